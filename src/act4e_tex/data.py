@@ -1,9 +1,11 @@
 import os
+from functools import lru_cache
 
 from zuper_commons.fs import read_ustring_from_utf8_file
 from zuper_commons.types import ZException
 
 
+@lru_cache(maxsize=None)
 def get_data_file(bn: str) -> str:
     import act4e_interfaces
     p = os.path.dirname(act4e_interfaces.__file__)